@@ -6,8 +6,11 @@ Provides natural, supportive voice for student learning.
 """
 
 import asyncio
+import inspect
 import numpy as np
 import os
+import time
+from importlib import metadata
 from typing import Optional
 
 from pipecat.frames.frames import OutputAudioRawFrame
@@ -15,6 +18,8 @@ from pipecat.services.tts_service import TTSService
 
 from kokoro_onnx import Kokoro
 
+from tts_frontend import TTSFrontEnd
+
 
 class KokoroTTSService(TTSService):
     """
@@ -25,6 +30,8 @@ class KokoroTTSService(TTSService):
     - ONNX inference (CPU compatible)
     - Async-safe (non-blocking)
     - Low memory footprint (~512MB)
+    - Text front-end: markdown/emoji stripping, number expansion,
+      cached phonemes (see tts_frontend.py)
     
     Usage:
         tts = KokoroTTSService(
@@ -56,6 +63,8 @@ class KokoroTTSService(TTSService):
         voice: str = "af_heart",
         speed: float = 1.0,
         lang: str = "en-us",
+        phoneme_cache_size: int = 2048,
+        phoneme_cache_path: Optional[str] = None,
         **kwargs
     ):
         """
@@ -67,6 +76,8 @@ class KokoroTTSService(TTSService):
             voice: Voice preset (see SUPPORTED_VOICES)
             speed: Speech speed (0.5-2.0, default 1.0)
             lang: Language code (default "en-us")
+            phoneme_cache_size: Max phrases kept in the phoneme LRU cache
+            phoneme_cache_path: Optional JSON file to persist the cache
             **kwargs: Additional arguments for TTSService
         """
         super().__init__(**kwargs)
@@ -104,10 +115,113 @@ class KokoroTTSService(TTSService):
             print(f"  - {voice_path}")
             raise
 
+        # Text front-end: normalize once, phonemize with a cache, then
+        # hand Kokoro phonemes so it skips its own G2P pass
+        phonemizer, self._phoneme_kwarg = self._detect_phoneme_support()
+        self.frontend = TTSFrontEnd(
+            phonemizer=phonemizer,
+            cache_size=phoneme_cache_size,
+            cache_path=phoneme_cache_path,
+            phonemizer_id=self._phonemizer_id(),
+        )
+        if phonemizer is None:
+            print("⚠️  Kokoro phonemizer not available, using text input")
+
+    def _detect_phoneme_support(self):
+        """
+        Find Kokoro's G2P function and how create() accepts phonemes.
+
+        kokoro-onnx has taken phonemes as `phonemes=` (0.3.x) and as
+        `is_phonemes=True` (0.4+). Returns (None, None) if neither is
+        supported, in which case plain text is passed to create().
+
+        Returns:
+            (phonemizer, keyword) tuple
+        """
+        tokenizer = getattr(self.tts, "tokenizer", None)
+        phonemize = getattr(tokenizer, "phonemize", None)
+        if phonemize is None:
+            return None, None
+
+        try:
+            params = inspect.signature(self.tts.create).parameters
+        except (TypeError, ValueError):
+            return None, None
+
+        for keyword in ("is_phonemes", "phonemes"):
+            if keyword in params:
+                return phonemize, keyword
+        return None, None
+
+    @staticmethod
+    def _phonemizer_id() -> str:
+        """
+        Identify the installed G2P build for the persisted phoneme cache.
+
+        Returns:
+            e.g. "kokoro-onnx 0.3.0; espeakng-loader 0.1.9"
+        """
+        parts = []
+        for package in ("kokoro-onnx", "espeakng-loader"):
+            try:
+                parts.append(f"{package} {metadata.version(package)}")
+            except metadata.PackageNotFoundError:
+                continue
+        return "; ".join(parts)
+
+    def _create(self, text: str):
+        """
+        Run front-end + Kokoro synthesis (blocking, call from a thread).
+
+        Args:
+            text: Raw text to synthesize
+
+        Returns:
+            (samples, sample_rate), or (None, None) if nothing speakable
+        """
+        start = time.perf_counter()
+        try:
+            normalized, phonemes = self.frontend.prepare(text, self.lang)
+
+            if phonemes is None:
+                # No phonemizer: still benefit from normalized text
+                if not normalized:
+                    return None, None
+                return self.tts.create(
+                    normalized,
+                    voice=self.voice,
+                    speed=self.speed,
+                    lang=self.lang
+                )
+
+            if not phonemes:
+                return None, None
+
+            if self._phoneme_kwarg == "is_phonemes":
+                return self.tts.create(
+                    phonemes,
+                    voice=self.voice,
+                    speed=self.speed,
+                    lang=self.lang,
+                    is_phonemes=True
+                )
+            return self.tts.create(
+                "",
+                voice=self.voice,
+                speed=self.speed,
+                lang=self.lang,
+                phonemes=phonemes
+            )
+        finally:
+            self.frontend.record_synthesis(time.perf_counter() - start)
+
     async def run_tts(self, text: str) -> None:
         """
         Main TTS entry point. Called by Pipecat pipeline.
         
+        A failed reply is logged and skipped rather than raised, so one
+        bad sentence never stops the conversation.
+        
         Args:
             text: Text to synthesize to speech
             
@@ -125,14 +239,14 @@ class KokoroTTSService(TTSService):
                 yield frame
         except Exception as e:
             print(f"❌ TTS Error: {e}")
-            raise
+            return
 
     async def _synthesize(self, text: str):
         """
         Synthesize text to speech using Kokoro.
         
         This method:
-        1. Runs blocking TTS in thread (non-blocking)
+        1. Runs front-end + blocking TTS in thread (non-blocking)
         2. Normalizes audio to proper format
         3. Yields audio frames for pipeline
         
@@ -145,13 +259,12 @@ class KokoroTTSService(TTSService):
         try:
             # Run blocking TTS creation in background thread
             # This keeps event loop responsive (can capture next audio input)
-            samples, sample_rate = await asyncio.to_thread(
-                self.tts.create,
-                text,
-                voice=self.voice,
-                speed=self.speed,
-                lang=self.lang
-            )
+            samples, sample_rate = await asyncio.to_thread(self._create, text)
+            
+            # Only markup/emoji, nothing to speak
+            if samples is None:
+                print("⚠️  Nothing speakable after text normalization")
+                return
             
             # Ensure samples is numpy array
             if not isinstance(samples, np.ndarray):
@@ -196,6 +309,28 @@ class KokoroTTSService(TTSService):
             print(f"   Speed: {self.speed}")
             raise
 
+    def get_timing(self) -> dict:
+        """
+        Return TTS timing, split into front-end (normalize + G2P) and total.
+        
+        Returns:
+            Front-end counters plus total synthesis seconds and
+            frontend_share (front-end seconds / synthesis seconds)
+        """
+        return self.frontend.get_stats()
+
+    def save_phoneme_cache(self) -> None:
+        """Persist the phoneme cache (no-op without phoneme_cache_path)."""
+        try:
+            self.frontend.save_cache()
+        except OSError as e:
+            print(f"⚠️  Could not save phoneme cache: {e}")
+
+    async def cleanup(self):
+        """Save the phoneme cache when the pipeline shuts down."""
+        await super().cleanup()
+        self.save_phoneme_cache()
+
     def get_info(self) -> dict:
         """
         Return TTS service information.
@@ -210,6 +345,7 @@ class KokoroTTSService(TTSService):
             "speed": self.speed,
             "language": self.lang,
             "sample_rate": 24000,
+            "phoneme_cache_size": len(self.frontend.cache),
             "supported_voices": list(self.SUPPORTED_VOICES.keys()),
             "supported_languages": list(self.SUPPORTED_LANGUAGES.keys())
         }
@@ -227,7 +363,8 @@ if __name__ == "__main__":
             model_path="models/kokoro-v1.0.onnx",
             voice_path="models/voices-v1.0.bin",
             voice="af_heart",
-            speed=1.0
+            speed=1.0,
+            phoneme_cache_path="models/phoneme_cache.json"
         )
         
         # Test synthesis
@@ -243,4 +380,14 @@ if __name__ == "__main__":
             print(f"Generated frame with {len(frame.audio)} bytes of audio")
             # In real usage, frame would be played to speaker
         
+        # Second run is served from the phoneme cache
+        async for frame in tts.run_tts(test_text):
+            pass
+        
+        timing = tts.get_timing()
+        print(f"\n⏱️  G2P: {timing['g2p_seconds']:.3f}s, "
+              f"total TTS: {timing['synthesis_seconds']:.3f}s, "
+              f"cache hit rate: {timing['cache_hit_rate']:.0%}")
+        tts.save_phoneme_cache()
+        
         print("\n✅ Test complete!")
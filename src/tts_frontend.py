@@ -0,0 +1,706 @@
+"""
+TTS Text Front-End
+
+Prepares LLM replies for Kokoro before synthesis:
+1. Normalizes text once (strips markdown/emoji, expands numbers and units)
+2. Converts phrases to phonemes with a bounded, persistable LRU cache
+3. Tracks its own timing so G2P cost can be separated from ONNX inference
+
+Tutoring replies reuse a small vocabulary and many stock phrases
+("Great job!", "Let's try another one."), so most phrases are
+phonemized once and then served from the cache.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+
+# ---------------------------------------------------------------------------
+# Precompiled normalization rules
+# ---------------------------------------------------------------------------
+
+# Markdown
+_CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`([^`]*)`")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+_URL_RE = re.compile(r"https?://\S+")
+_HEADER_RE = re.compile(r"^\s{0,3}#{1,6}\s*", re.MULTILINE)
+_LIST_MARKER_RE = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+", re.MULTILINE)
+_EMPHASIS_RE = re.compile(r"(\*{1,3}|_{2,3}|~~)(.+?)\1")
+_STRAY_MARKUP_RE = re.compile(r"[*_~#>|`]+")
+
+# Emoji and pictographs (symbols, dingbats, flags, variation selectors)
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F000-\U0001FAFF"
+    "\U00002600-\U000027BF"
+    "\U0001F1E6-\U0001F1FF"
+    "\U00002B00-\U00002BFF"
+    "\U0000FE00-\U0000FE0F"
+    "\U0000200D"
+    "]+"
+)
+
+# Numbers, currency and units
+_THOUSANDS_RE = re.compile(r"(?<=\d),(?=\d{3}\b)")
+_CURRENCY_RE = re.compile(r"\$(\d+)(?:\.(\d{1,2}))?\b")
+# A leading "-" is a minus sign only when it does not follow a word ("3-4")
+_SIGNED = r"((?:(?<![\w.])-)?\d+(?:\.\d+)?)"
+_PERCENT_RE = re.compile(_SIGNED + r"\s?%")
+_ORDINAL_RE = re.compile(r"\b(\d+)(st|nd|rd|th)\b", re.IGNORECASE)
+_TIME_RE = re.compile(r"(?<![\d:])(\d{1,2}):([0-5]\d)(?![\d:])")
+_FRACTION_RE = re.compile(r"(?<![\d/])(\d{1,3})/(\d{1,2})(?![\d/])")
+_DOTTED_RE = re.compile(r"(?<![\d.])\d+(?:\.\d+){2,}(?![\d.])")
+_PLURAL_NUMBER_RE = re.compile(r"(?<![\d.])(\d+)['’]?s\b")
+_DECIMAL_RE = re.compile(r"(?<![\d.])((?<![\w.])-)?(\d+)\.(\d+)\b")
+_INTEGER_RE = re.compile(r"(?<![\d.])((?<![\w.])-)?(\d+)\b")
+
+# Whitespace / line structure
+_NEWLINES_RE = re.compile(r"\s*\n+\s*")
+_SPACES_RE = re.compile(r"[ \t]+")
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([,.;:!?])")
+_REPEATED_PUNCT_RE = re.compile(r"([,.;:!?])[,.;:!?]+")
+
+# Bump when the persisted cache format or normalization rules change
+_CACHE_VERSION = 2
+
+# Phrase boundaries used as phoneme cache keys. "." / "!" / "?" only end a
+# phrase before whitespace, and never after "e.g", "Ph.D" or "Dr", so
+# abbreviations reach the phonemizer intact; ":" between digits is kept.
+_PHRASE_BOUNDARY_RE = re.compile(
+    r"((?:[,;]|(?<!\d):|:(?!\d)"
+    r"|(?<!\.[A-Za-z])(?<!\b[DMS][rst])(?<!\bvs)(?<!\bMrs)[.!?](?=[\s,;:.!?]|$))+)"
+)
+
+_UNITS = {
+    "km/h": "kilometers per hour",
+    "mph": "miles per hour",
+    "km": "kilometers",
+    "cm": "centimeters",
+    "mm": "millimeters",
+    "kg": "kilograms",
+    "mg": "milligrams",
+    "ml": "milliliters",
+    "°C": "degrees Celsius",
+    "°F": "degrees Fahrenheit",
+    "°": "degrees",
+    "min": "minutes",
+    "hr": "hours",
+    "sec": "seconds",
+    "secs": "seconds",
+}
+
+# One-letter units read as letters in spelling talk ("2 m's", "4 s"),
+# so they only expand when glued to the number ("3m"). "s" is left out:
+# "1990s" and "10s of students" are plurals, not seconds.
+_SHORT_UNITS = {
+    "m": "meters",
+    "g": "grams",
+    "l": "liters",
+    "h": "hours",
+}
+
+# Never expand before a letter, apostrophe or quote ("2 mm's")
+_UNIT_END = r")(?![A-Za-z'’\"])"
+
+# Longest units first so "km/h" wins over "km"
+_UNIT_RE = re.compile(
+    _SIGNED + r"\s?("
+    + "|".join(re.escape(u) for u in sorted(_UNITS, key=len, reverse=True))
+    + _UNIT_END
+)
+_SHORT_UNIT_RE = re.compile(
+    _SIGNED + r"(" + "|".join(_SHORT_UNITS) + _UNIT_END
+)
+
+_ONES = [
+    "zero", "one", "two", "three", "four", "five", "six", "seven", "eight",
+    "nine", "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen",
+    "sixteen", "seventeen", "eighteen", "nineteen",
+]
+_TENS = [
+    "", "", "twenty", "thirty", "forty", "fifty",
+    "sixty", "seventy", "eighty", "ninety",
+]
+_SCALES = [
+    (1_000_000_000_000, "trillion"),
+    (1_000_000_000, "billion"),
+    (1_000_000, "million"),
+    (1_000, "thousand"),
+]
+_ORDINAL_IRREGULAR = {
+    "one": "first", "two": "second", "three": "third", "five": "fifth",
+    "eight": "eighth", "nine": "ninth", "twelve": "twelfth",
+}
+
+
+def number_to_words(n: int) -> str:
+    """
+    Spell out an integer in English ("142" -> "one hundred forty-two").
+
+    Args:
+        n: Integer to spell out
+
+    Returns:
+        Number as words
+    """
+    if n < 0:
+        return "minus " + number_to_words(-n)
+    if n < 20:
+        return _ONES[n]
+    if n < 100:
+        tens, ones = divmod(n, 10)
+        return _TENS[tens] + (f"-{_ONES[ones]}" if ones else "")
+    if n < 1000:
+        hundreds, rest = divmod(n, 100)
+        words = f"{_ONES[hundreds]} hundred"
+        return words + (f" {number_to_words(rest)}" if rest else "")
+    for scale, name in _SCALES:
+        if n >= scale:
+            major, rest = divmod(n, scale)
+            words = f"{number_to_words(major)} {name}"
+            return words + (f" {number_to_words(rest)}" if rest else "")
+    # Larger than the biggest scale: read digit by digit
+    return " ".join(_ONES[int(d)] for d in str(n))
+
+
+def ordinal_to_words(n: int) -> str:
+    """Spell out an ordinal ("21" -> "twenty-first")."""
+    words = number_to_words(n)
+    head, sep, last = words.rpartition(" ")
+    prefix, dash, tail = last.rpartition("-")
+    if tail in _ORDINAL_IRREGULAR:
+        tail = _ORDINAL_IRREGULAR[tail]
+    elif tail.endswith("y"):
+        tail = tail[:-1] + "ieth"
+    else:
+        tail += "th"
+    return head + sep + prefix + dash + tail
+
+
+def year_to_words(n: int) -> str:
+    """Spell out a year ("1990" -> "nineteen ninety")."""
+    high, low = divmod(n, 100)
+    if 2000 <= n < 2010:
+        return number_to_words(n)
+    if low == 0:
+        return f"{number_to_words(high)} hundred"
+    if low < 10:
+        return f"{number_to_words(high)} oh {number_to_words(low)}"
+    return f"{number_to_words(high)} {number_to_words(low)}"
+
+
+def _integer_to_words(n: int) -> str:
+    # Bare 4-digit numbers in this range are almost always years in replies
+    if 1100 <= n <= 2099:
+        return year_to_words(n)
+    return number_to_words(n)
+
+
+def _decimal_to_words(sign: str, whole: str, frac: str) -> str:
+    words = number_to_words(int(whole))
+    words += " point " + " ".join(_ONES[int(d)] for d in frac)
+    return ("minus " if sign else "") + words
+
+
+def _number_token_to_words(token: str) -> str:
+    sign = "-" if token.startswith("-") else ""
+    whole, _, frac = token.lstrip("-").partition(".")
+    if frac:
+        return _decimal_to_words(sign, whole, frac)
+    return number_to_words(-int(whole) if sign else int(whole))
+
+
+def _expand_currency(match: re.Match) -> str:
+    dollars = int(match.group(1))
+    words = f"{number_to_words(dollars)} dollar{'s' if dollars != 1 else ''}"
+    # "$3.5" means three dollars fifty
+    cents = int(match.group(2).ljust(2, "0")) if match.group(2) else 0
+    if cents:
+        words += f" and {number_to_words(cents)} cent{'s' if cents != 1 else ''}"
+    return words
+
+
+def _expand_unit(match: re.Match) -> str:
+    value, unit = match.group(1), match.group(2)
+    words = _UNITS.get(unit) or _SHORT_UNITS[unit]
+    # "1 meter", "1 kilometer per hour" — singularize the leading noun
+    if value in ("1", "-1") and words.split(" ")[0].endswith("s"):
+        first, _, rest = words.partition(" ")
+        words = first[:-1] + (f" {rest}" if rest else "")
+    return f"{_number_token_to_words(value)} {words}"
+
+
+def _expand_time(match: re.Match) -> str:
+    hours, minutes = int(match.group(1)), int(match.group(2))
+    if minutes == 0:
+        return f"{number_to_words(hours)} o'clock"
+    if minutes < 10:
+        return f"{number_to_words(hours)} oh {number_to_words(minutes)}"
+    return f"{number_to_words(hours)} {number_to_words(minutes)}"
+
+
+def _expand_fraction(match: re.Match) -> str:
+    numerator, denominator = int(match.group(1)), int(match.group(2))
+    if denominator in (0, 1):
+        return f"{number_to_words(numerator)} over {number_to_words(denominator)}"
+    if denominator == 2:
+        name = "half" if numerator == 1 else "halves"
+    else:
+        name = ordinal_to_words(denominator) + ("" if numerator == 1 else "s")
+    return f"{number_to_words(numerator)} {name}"
+
+
+def _expand_plural_number(match: re.Match) -> str:
+    # "1990s" -> "nineteen nineties", "10s" -> "tens", "6s" -> "sixes"
+    n = int(match.group(1))
+    if n in (100, 1000):
+        return "hundreds" if n == 100 else "thousands"
+    words = _integer_to_words(n)
+    if words.endswith("y"):
+        return words[:-1] + "ies"
+    if words.endswith("x"):
+        return words + "es"
+    return words + "s"
+
+
+def _expand_dotted(match: re.Match) -> str:
+    # Versions and section numbers: "3.10.2" -> "three point ten point two"
+    return " point ".join(number_to_words(int(p)) for p in match.group(0).split("."))
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize LLM output into plain, speakable text.
+
+    Removes markdown, code, URLs and emoji, then expands currency,
+    percentages, units, times, fractions, ordinals, years and numbers
+    into words.
+
+    Args:
+        text: Raw LLM reply
+
+    Returns:
+        Speakable text (may be empty if nothing speakable remains)
+    """
+    # Markup
+    text = _CODE_BLOCK_RE.sub(" ", text)
+    text = _INLINE_CODE_RE.sub(r"\1", text)
+    text = _LINK_RE.sub(r"\1", text)
+    text = _URL_RE.sub(" ", text)
+    text = _HEADER_RE.sub("", text)
+    text = _LIST_MARKER_RE.sub("", text)
+    text = _EMPHASIS_RE.sub(r"\2", text)
+    text = _STRAY_MARKUP_RE.sub(" ", text)
+    text = _EMOJI_RE.sub(" ", text)
+
+    # Numbers
+    text = _THOUSANDS_RE.sub("", text)
+    text = _CURRENCY_RE.sub(_expand_currency, text)
+    text = _PERCENT_RE.sub(
+        lambda m: f"{_number_token_to_words(m.group(1))} percent", text
+    )
+    text = _UNIT_RE.sub(_expand_unit, text)
+    text = _SHORT_UNIT_RE.sub(_expand_unit, text)
+    text = _TIME_RE.sub(_expand_time, text)
+    text = _FRACTION_RE.sub(_expand_fraction, text)
+    text = _DOTTED_RE.sub(_expand_dotted, text)
+    text = _PLURAL_NUMBER_RE.sub(_expand_plural_number, text)
+    text = _ORDINAL_RE.sub(lambda m: ordinal_to_words(int(m.group(1))), text)
+    text = _DECIMAL_RE.sub(
+        lambda m: _decimal_to_words(m.group(1), m.group(2), m.group(3)), text
+    )
+    text = _INTEGER_RE.sub(
+        lambda m: (
+            "minus " + number_to_words(int(m.group(2))) if m.group(1)
+            else _integer_to_words(int(m.group(2)))
+        ),
+        text,
+    )
+
+    # Line breaks become sentence breaks (list items, paragraphs)
+    text = _NEWLINES_RE.sub(". ", text.strip())
+    text = _SPACES_RE.sub(" ", text)
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text)
+    text = _REPEATED_PUNCT_RE.sub(r"\1", text)
+    text = text.strip()
+
+    # Nothing left but punctuation (e.g. an emoji-only reply)
+    if not text.strip(" ,.;:!?"):
+        return ""
+    return text
+
+
+class PhonemeCache:
+    """
+    Bounded LRU cache mapping (lang, phrase) -> phonemes.
+
+    Thread-safe, since synthesis runs in worker threads.
+    Can be persisted to a JSON file and reloaded at startup. A saved file
+    is only reused if its format version and phonemizer id match, so an
+    espeak/kokoro-onnx upgrade never replays stale phonemes.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 2048,
+        path: Optional[str] = None,
+        phonemizer_id: str = "",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached phrases
+            path: Optional JSON file to load from / save to
+            phonemizer_id: Identifies the G2P build (e.g. "kokoro-onnx 0.3.0")
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        self.max_size = max_size
+        self.path = path
+        self.phonemizer_id = phonemizer_id
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def get(self, lang: str, phrase: str) -> Optional[str]:
+        """Return cached phonemes (and mark as recently used), or None."""
+        key = (lang, phrase)
+        with self._lock:
+            phonemes = self._entries.get(key)
+            if phonemes is not None:
+                self._entries.move_to_end(key)
+            return phonemes
+
+    def put(self, lang: str, phrase: str, phonemes: str) -> None:
+        """Store phonemes, evicting the least recently used entry if full."""
+        key = (lang, phrase)
+        with self._lock:
+            self._entries[key] = phonemes
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def load(self, path: Optional[str] = None) -> int:
+        """
+        Load entries from a JSON file.
+
+        The cache is only an optimization: unreadable, malformed or
+        outdated files are skipped with a warning, never raised.
+
+        Args:
+            path: File to read (defaults to self.path)
+
+        Returns:
+            Number of entries loaded
+        """
+        path = path or self.path
+        if not path:
+            return 0
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            entries = data.get("entries", [])
+            if not isinstance(entries, list):
+                raise ValueError("'entries' must be a list")
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not load phoneme cache {path}: {e}")
+            return 0
+
+        if data.get("version") != _CACHE_VERSION:
+            print(f"⚠️  Ignoring phoneme cache {path}: format version changed")
+            return 0
+        if data.get("phonemizer") != self.phonemizer_id:
+            print(f"⚠️  Ignoring phoneme cache {path}: phonemizer changed")
+            return 0
+
+        skipped = 0
+        for entry in entries:
+            if (
+                not isinstance(entry, list)
+                or len(entry) != 3
+                or not all(isinstance(field, str) for field in entry)
+            ):
+                skipped += 1
+                continue
+            lang, phrase, phonemes = entry
+            self.put(lang, phrase, phonemes)
+
+        if skipped:
+            print(f"⚠️  Skipped {skipped} malformed phoneme cache entries in {path}")
+        return len(self)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write entries to a JSON file (oldest first, so reload keeps LRU order).
+
+        Args:
+            path: File to write (defaults to self.path)
+        """
+        path = path or self.path
+        if not path:
+            return
+
+        with self._lock:
+            entries = [
+                [lang, phrase, ph] for (lang, phrase), ph in self._entries.items()
+            ]
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write to a temp file first so a crash never leaves a truncated cache
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": _CACHE_VERSION,
+                    "phonemizer": self.phonemizer_id,
+                    "entries": entries,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class TTSFrontEnd:
+    """
+    Text front-end for Kokoro: normalization + cached G2P + timing.
+
+    Normally used through KokoroTTSService, which reports these
+    counters via get_timing().
+
+    Usage:
+        frontend = TTSFrontEnd(kokoro.tokenizer.phonemize)
+        normalized, phonemes = frontend.prepare("**Great job!** 🎉", "en-us")
+        print(frontend.get_stats())  # same dict as get_timing()
+    """
+
+    def __init__(
+        self,
+        phonemizer: Optional[Callable[[str, str], str]] = None,
+        cache_size: int = 2048,
+        cache_path: Optional[str] = None,
+        phonemizer_id: str = "",
+    ):
+        """
+        Initialize the front-end.
+
+        Args:
+            phonemizer: G2P function (text, lang) -> phonemes.
+                        If None, only normalization is performed.
+            cache_size: Maximum number of cached phrases
+            cache_path: Optional JSON file for persisting the cache
+            phonemizer_id: Identifies the G2P build; a saved cache made
+                           by a different build is discarded
+        """
+        self.phonemizer = phonemizer
+        self.cache = PhonemeCache(
+            max_size=cache_size,
+            path=cache_path,
+            phonemizer_id=phonemizer_id,
+        )
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Reset timing counters."""
+        with self._stats_lock:
+            self.calls = 0
+            self.normalize_seconds = 0.0
+            self.g2p_seconds = 0.0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.synthesis_seconds = 0.0
+
+    def normalize(self, text: str) -> str:
+        """Normalize text and record the time spent."""
+        start = time.perf_counter()
+        normalized = normalize_text(text)
+        elapsed = time.perf_counter() - start
+
+        with self._stats_lock:
+            self.normalize_seconds += elapsed
+        return normalized
+
+    def phonemize(self, text: str, lang: str) -> Optional[str]:
+        """Normalize text and return its phonemes (see prepare())."""
+        return self.prepare(text, lang)[1]
+
+    def prepare(self, text: str, lang: str) -> Tuple[str, Optional[str]]:
+        """
+        Normalize text once and convert it to phonemes, phrase by phrase.
+
+        Each phrase (text between sentence punctuation and , ; :) is
+        looked up in the cache; only misses are sent to the phonemizer.
+        Punctuation is kept between phrases so Kokoro still gets pauses
+        and intonation.
+
+        Args:
+            text: Raw text to speak
+            lang: Language code (e.g. "en-us")
+
+        Returns:
+            (normalized, phonemes) tuple. phonemes is "" if nothing is
+            speakable, or None if no phonemizer is configured.
+        """
+        normalized = self.normalize(text)
+        if self.phonemizer is None:
+            with self._stats_lock:
+                self.calls += 1
+            return normalized, None
+
+        start = time.perf_counter()
+        hits = misses = 0
+        parts = []
+
+        pieces = _PHRASE_BOUNDARY_RE.split(normalized)
+        for phrase, punct in zip(pieces[::2], pieces[1::2] + [""]):
+            phrase = phrase.strip()
+            if phrase:
+                phonemes = self.cache.get(lang, phrase)
+                if phonemes is None:
+                    phonemes = self.phonemizer(phrase, lang).strip()
+                    self.cache.put(lang, phrase, phonemes)
+                    misses += 1
+                else:
+                    hits += 1
+                parts.append(phonemes)
+            if punct:
+                parts.append(punct)
+            parts.append(" ")
+
+        elapsed = time.perf_counter() - start
+        with self._stats_lock:
+            self.calls += 1
+            self.g2p_seconds += elapsed
+            self.cache_hits += hits
+            self.cache_misses += misses
+
+        phonemes = _SPACE_BEFORE_PUNCT_RE.sub(r"\1", "".join(parts)).strip()
+        return normalized, phonemes
+
+    def record_synthesis(self, seconds: float) -> None:
+        """
+        Add total synthesis time (front-end + ONNX) for one reply.
+
+        Lets get_stats() report what share of TTS time the front-end takes.
+        """
+        with self._stats_lock:
+            self.synthesis_seconds += seconds
+
+    def save_cache(self) -> None:
+        """Persist the phoneme cache (no-op without a cache_path)."""
+        self.cache.save()
+
+    def get_stats(self) -> dict:
+        """
+        Return timing and cache counters.
+
+        Returns:
+            Dictionary with call count, normalization/G2P seconds, cache
+            hit rate, total synthesis seconds and front-end share of it
+        """
+        with self._stats_lock:
+            lookups = self.cache_hits + self.cache_misses
+            frontend_seconds = self.normalize_seconds + self.g2p_seconds
+            return {
+                "calls": self.calls,
+                "normalize_seconds": self.normalize_seconds,
+                "g2p_seconds": self.g2p_seconds,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "cache_hit_rate": self.cache_hits / lookups if lookups else 0.0,
+                "cache_size": len(self.cache),
+                "synthesis_seconds": self.synthesis_seconds,
+                "frontend_share": (
+                    frontend_seconds / self.synthesis_seconds
+                    if self.synthesis_seconds else 0.0
+                ),
+            }
+
+
+# Regression cases for the normalizer: python src/tts_frontend.py
+if __name__ == "__main__":
+    cases = [
+        ("There are 2 m's in comma", "There are two m's in comma"),
+        ("Mississippi has 4 s and 4 i", "Mississippi has four s and four i"),
+        ("Spell it with 2 l", "Spell it with two l"),
+        ("The answer is 3 h", "The answer is three h"),
+        (
+            "Run 5 sec, then 3m, then 2 km",
+            "Run five seconds, then three meters, then two kilometers",
+        ),
+        ("the 1990s", "the nineteen nineties"),
+        ("10s of students", "tens of students"),
+        ("Roll two 6s in the 80's", "Roll two sixes in the eighties"),
+        (
+            "The year 2024 came after 1990",
+            "The year twenty twenty-four came after nineteen ninety",
+        ),
+        (
+            "In 1905, 2005 and 1800",
+            "In nineteen oh five, two thousand five and eighteen hundred",
+        ),
+        (
+            "It is 1500 km and 1200%",
+            "It is one thousand five hundred kilometers and one thousand two hundred percent",
+        ),
+        (
+            "It costs $5.5 or $3.05",
+            "It costs five dollars and fifty cents or three dollars and five cents",
+        ),
+        ("Save $1,000.50 today", "Save one thousand dollars and fifty cents today"),
+        ("Class starts at 10:45", "Class starts at ten forty-five"),
+        ("Lunch at 12:00 or 9:05", "Lunch at twelve o'clock or nine oh five"),
+        ("I scored 3/4 and 1/2", "I scored three fourths and one half"),
+        ("Version 3.10.2", "Version three point ten point two"),
+        ("**Great job!** You got 3 right 🎉", "Great job! You got three right"),
+        ("It is -4°C, pages 3-4", "It is minus four degrees Celsius, pages three-four"),
+    ]
+    failures = 0
+    for text, expected in cases:
+        result = normalize_text(text)
+        if result != expected:
+            failures += 1
+            print(f"❌ {text!r}\n   got:      {result!r}\n   expected: {expected!r}")
+
+    phrase_cases = [
+        ("Use nouns, e.g. cat or dog.", ["Use nouns", "e.g. cat or dog"]),
+        (
+            "Ask Dr. Lee, she has a Ph.D. in math!",
+            ["Ask Dr. Lee", "she has a Ph.D. in math"],
+        ),
+    ]
+    for text, expected in phrase_cases:
+        pieces = _PHRASE_BOUNDARY_RE.split(normalize_text(text))
+        result = [p.strip() for p in pieces[::2] if p.strip()]
+        if result != expected:
+            failures += 1
+            print(f"❌ {text!r}\n   got:      {result!r}\n   expected: {expected!r}")
+
+    total = len(cases) + len(phrase_cases)
+    print(f"✅ {total - failures}/{total} normalization cases passed")
@@ -1,15 +1,13 @@
 import asyncio
 import sys
-import numpy as np
 import os
 
-from pipecat.frames.frames import EndFrame, OutputAudioRawFrame, TextFrame
+from pipecat.frames.frames import EndFrame, TextFrame
 
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineTask
 
-from pipecat.services.tts_service import TTSService
 from pipecat.services.ollama.llm import OLLamaLLMService
 from pipecat.services.whisper.stt import WhisperSTTService
 
@@ -22,50 +20,10 @@ from pipecat.processors.aggregators.llm_response import (
 )
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
 
-from kokoro_onnx import Kokoro
+from kokoro_tts import KokoroTTSService
 
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
 
-class KokoroTTSService(TTSService):
-    def __init__(self, model_path="kokoro-v1.0.onnx", voice_path="voices-v1.0.bin", **kwargs):
-        super().__init__(**kwargs)
-        print("🎙️ Loading Kokoro ONNX TTS...")
-        self.tts = Kokoro(model_path, voice_path)
-        print("✅ Ready!")
-
-    # Fixed: Pipecat expects run_tts to be an async generator
-    async def run_tts(self, text: str):
-        print(f"🔊 Synthesizing: {text[:30]}...")
-        async for frame in self._synthesize(text):
-            yield frame
-
-    async def _synthesize(self, text: str):
-        try:
-            # Run the blocking TTS creation in a thread to keep the loop free
-            samples, _ = await asyncio.to_thread(
-                self.tts.create,
-                text,
-                voice="af_heart",
-                speed=1.0,
-                lang="en-us"
-            )
-            
-            if not isinstance(samples, np.ndarray):
-                samples = np.array(samples)
-            
-            # Normalize and convert to int16
-            audio_int16 = (samples * 32767).astype(np.int16)
-            
-            # Yield the audio frame back to the pipeline
-            yield OutputAudioRawFrame(
-                audio=audio_int16.tobytes(),
-                sample_rate=24000,
-                num_channels=1
-            )
-            
-        except Exception as e:
-            print(f"❌ TTS Error: {e}")
-
 SYSTEM_PROMPT = (
     "You are a patient and supportive Teaching Assistant. "
     "Your goal is to help students who struggle with reading by explaining concepts simply. "
@@ -91,7 +49,11 @@ async def main():
 
     # Services
     llm = OLLamaLLMService(model="llama3.2", base_url="http://localhost:11434/v1")
-    tts = KokoroTTSService(model_path="kokoro-v1.0.onnx", voice_path="voices-v1.0.bin")
+    tts = KokoroTTSService(
+        model_path="kokoro-v1.0.onnx",
+        voice_path="voices-v1.0.bin",
+        phoneme_cache_path="phoneme_cache.json",
+    )
     stt = WhisperSTTService(
         model_size="tiny",
         device="cpu",
@@ -119,7 +81,14 @@ async def main():
     print("✅ System Ready. Listening for your voice...")
 
     runner = PipelineRunner()
-    await runner.run(task)
+    try:
+        await runner.run(task)
+    finally:
+        # Phoneme cache is saved by tts.cleanup(); just report G2P cost
+        timing = tts.get_timing()
+        print(f"⏱️  TTS front-end: {timing['frontend_share']:.0%} of "
+              f"{timing['synthesis_seconds']:.1f}s synthesis, "
+              f"phoneme cache hit rate {timing['cache_hit_rate']:.0%}")
 
 if __name__ == "__main__":
     try: